@@ -14,7 +14,7 @@ _PARENT_DIR = Path(__file__).parent.parent
 if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
-from core.auth import get_auth_token, get_auth_token_source
+from core.auth import get_auth_token, get_auth_token_source, prefetch_keychain_token
 from dotenv import load_dotenv
 from graphiti_config import get_graphiti_status
 from linear_integration import LinearManager
@@ -51,6 +51,10 @@ def setup_environment() -> Path:
     elif dev_env_file.exists():
         load_dotenv(dev_env_file)
 
+    # Warm the macOS Keychain token cache in the background (after .env is
+    # loaded, so an env token skips the lookup entirely)
+    prefetch_keychain_token()
+
     return script_dir
 
 
@@ -9,27 +9,55 @@ for custom API endpoints.
 import json
 import os
 import platform
+import re
 import subprocess
+import threading
+
+# Evaluated once; the platform can't change during a process lifetime
+_IS_DARWIN = platform.system() == "Darwin"
 
 # Priority order for auth token resolution
 # NOTE: We intentionally do NOT fall back to ANTHROPIC_API_KEY.
 # Auto Claude is designed to use Claude Code OAuth tokens only.
 # This prevents silent billing to user's API credits when OAuth fails.
-AUTH_TOKEN_ENV_VARS = [
+AUTH_TOKEN_ENV_VARS = (
     "CLAUDE_CODE_OAUTH_TOKEN",  # OAuth token from Claude Code CLI
     "ANTHROPIC_AUTH_TOKEN",  # CCR/proxy token (for enterprise setups)
-]
+)
 
 # Environment variables to pass through to SDK subprocess
 # NOTE: ANTHROPIC_API_KEY is intentionally excluded to prevent silent API billing
-SDK_ENV_VARS = [
+SDK_ENV_VARS = (
     "ANTHROPIC_BASE_URL",
     "ANTHROPIC_AUTH_TOKEN",
     "NO_PROXY",
     "DISABLE_TELEMETRY",
     "DISABLE_COST_WARNINGS",
     "API_TIMEOUT_MS",
-]
+)
+
+# Keychain item where Claude Code stores its OAuth credentials
+KEYCHAIN_SERVICE_NAME = "Claude Code-credentials"
+
+# Claude OAuth access token (always prefixed sk-ant-oat01-) in the credentials JSON.
+# Only token characters match, so the captured bytes always decode as ASCII.
+_ACCESS_TOKEN_RE = re.compile(rb'"accessToken"\s*:\s*"(sk-ant-oat01-[A-Za-z0-9_\-]+)"')
+
+# Cache the Keychain lookup to avoid spawning /usr/bin/security on every call.
+# A sentinel distinguishes "not yet queried" from a cached "no token" (None).
+_KEYCHAIN_TOKEN_SENTINEL = object()
+_keychain_token_cache: str | None | object = _KEYCHAIN_TOKEN_SENTINEL
+
+# Guards cache writes. The generation is bumped on invalidation so a lookup
+# that started before it (e.g. a slow prefetch) can't store a stale result.
+_keychain_lock = threading.Lock()
+_keychain_generation = 0
+
+# Background Keychain lookup started at CLI startup (see prefetch_keychain_token)
+_keychain_prefetch_thread: threading.Thread | None = None
+
+# Max seconds to wait on an in-flight prefetch (matches the security CLI timeout)
+KEYCHAIN_PREFETCH_JOIN_TIMEOUT = 5.0
 
 
 def get_token_from_keychain() -> str | None:
@@ -37,15 +65,99 @@ def get_token_from_keychain() -> str | None:
     Get authentication token from macOS Keychain.
 
     Reads Claude Code credentials from macOS Keychain and extracts the OAuth token.
-    Only works on macOS (Darwin platform).
+    Only works on macOS (Darwin platform). The result (including a miss) is
+    cached for the lifetime of the process.
 
     Returns:
         Token string if found in Keychain, None otherwise
     """
+    if _keychain_token_cache is not _KEYCHAIN_TOKEN_SENTINEL:
+        return _keychain_token_cache
+
+    # Reuse the startup prefetch rather than starting a second lookup
+    thread = _keychain_prefetch_thread
+    if thread is not None and thread.is_alive():
+        thread.join(timeout=KEYCHAIN_PREFETCH_JOIN_TIMEOUT)
+        if _keychain_token_cache is _KEYCHAIN_TOKEN_SENTINEL:
+            # The Keychain is stalled; don't queue a second lookup behind it
+            return None
+        return _keychain_token_cache
+
+    generation = _keychain_generation
+    token = _query_keychain_token()
+    _store_keychain_token(token, generation)
+    return token
+
+
+def prefetch_keychain_token() -> None:
+    """
+    Start a background macOS Keychain lookup to warm the token cache.
+
+    Called once at startup so the first get_auth_token() on an interactive
+    path doesn't block on the Keychain. Does nothing off macOS, when an
+    auth token is already set in the environment, or when the lookup has
+    already been cached or started.
+    """
+    global _keychain_prefetch_thread
+
+    if not _IS_DARWIN:
+        return
+    if any(os.environ.get(var) for var in AUTH_TOKEN_ENV_VARS):
+        return
+    if _keychain_token_cache is not _KEYCHAIN_TOKEN_SENTINEL:
+        return
+    if _keychain_prefetch_thread is not None:
+        return
+
+    _keychain_prefetch_thread = threading.Thread(
+        target=_prefetch_keychain_token,
+        args=(_keychain_generation,),
+        name="keychain-prefetch",
+        daemon=True,
+    )
+    _keychain_prefetch_thread.start()
+
+
+def _prefetch_keychain_token(generation: int) -> None:
+    """Thread target: query the Keychain and store the result in the cache."""
+    _store_keychain_token(_query_keychain_token(), generation)
+
+
+def _store_keychain_token(token: str | None, generation: int) -> None:
+    """Cache a lookup result unless the cache was invalidated since it started."""
+    global _keychain_token_cache
+
+    with _keychain_lock:
+        if generation == _keychain_generation:
+            _keychain_token_cache = token
+
+
+def _invalidate_keychain_cache() -> None:
+    """Reset the cached Keychain token (useful for testing or re-authentication)."""
+    global _keychain_token_cache, _keychain_prefetch_thread, _keychain_generation
+
+    with _keychain_lock:
+        _keychain_generation += 1
+        _keychain_token_cache = _KEYCHAIN_TOKEN_SENTINEL
+        _keychain_prefetch_thread = None
+
+
+def _query_keychain_token() -> str | None:
+    """Query macOS Keychain for the Claude Code OAuth token (uncached)."""
     # Only attempt on macOS
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
+        return None
+
+    credentials = _read_keychain_subprocess()
+
+    if not credentials:
         return None
 
+    return _extract_oauth_token(credentials)
+
+
+def _read_keychain_subprocess() -> bytes | None:
+    """Read Claude Code credentials by shelling out to the security CLI."""
     try:
         # Query macOS Keychain for Claude Code credentials
         result = subprocess.run(
@@ -53,40 +165,85 @@ def get_token_from_keychain() -> str | None:
                 "/usr/bin/security",
                 "find-generic-password",
                 "-s",
-                "Claude Code-credentials",
+                KEYCHAIN_SERVICE_NAME,
                 "-w",
             ],
-            capture_output=True,
-            text=True,
+            # Raw bytes feed the token regex directly; stderr is never read
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
             timeout=5,
         )
+    except (subprocess.SubprocessError, OSError):
+        # Silently fail (timeout, missing binary) - this is a fallback mechanism
+        return None
 
-        if result.returncode != 0:
-            return None
+    if result.returncode != 0:
+        return None
 
-        # Parse JSON response
-        credentials_json = result.stdout.strip()
-        if not credentials_json:
-            return None
+    return result.stdout
 
-        data = json.loads(credentials_json)
 
-        # Extract OAuth token from nested structure
-        token = data.get("claudeAiOauth", {}).get("accessToken")
+def _extract_oauth_token(credentials: bytes) -> str | None:
+    """
+    Extract the Claude OAuth access token from a Keychain credentials payload.
 
-        if not token:
-            return None
+    Args:
+        credentials: Raw JSON credentials bytes as stored by Claude Code
 
-        # Validate token format (Claude OAuth tokens start with sk-ant-oat01-)
-        if not token.startswith("sk-ant-oat01-"):
-            return None
+    Returns:
+        Token string if present and well-formed, None otherwise
+    """
+    # Fast path: pull the token out directly without building the JSON tree
+    match = _ACCESS_TOKEN_RE.search(credentials)
+    if match:
+        return match.group(1).decode("ascii")
+
+    # Fall back to a full JSON parse (e.g. escaped or unusual payloads)
+    credentials = credentials.strip()
+    if not credentials:
+        return None
 
-        return token
+    try:
+        data = json.loads(credentials)
+    except ValueError:
+        # Covers json.JSONDecodeError and UnicodeDecodeError
+        return None
 
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, KeyError, Exception):
-        # Silently fail - this is a fallback mechanism
+    # Extract OAuth token from nested structure
+    oauth = data.get("claudeAiOauth") if isinstance(data, dict) else None
+    token = oauth.get("accessToken") if isinstance(oauth, dict) else None
+
+    if not token or not isinstance(token, str):
+        return None
+
+    # Validate token format (Claude OAuth tokens start with sk-ant-oat01-)
+    if not token.startswith("sk-ant-oat01-"):
         return None
 
+    return token
+
+
+def _resolve_auth_token() -> tuple[str | None, str | None]:
+    """
+    Resolve the auth token and its source in a single pass.
+
+    Returns:
+        Tuple of (token, source name), or (None, None) if no token is found
+    """
+    # First check environment variables
+    for var in AUTH_TOKEN_ENV_VARS:
+        token = os.environ.get(var)
+        if token:
+            return token, var
+
+    # Fallback to macOS Keychain
+    token = get_token_from_keychain()
+    if token:
+        return token, "macOS Keychain"
+
+    return None, None
+
 
 def get_auth_token() -> str | None:
     """
@@ -103,28 +260,12 @@ def get_auth_token() -> str | None:
     Returns:
         Token string if found, None otherwise
     """
-    # First check environment variables
-    for var in AUTH_TOKEN_ENV_VARS:
-        token = os.environ.get(var)
-        if token:
-            return token
-
-    # Fallback to macOS Keychain
-    return get_token_from_keychain()
+    return _resolve_auth_token()[0]
 
 
 def get_auth_token_source() -> str | None:
     """Get the name of the source that provided the auth token."""
-    # Check environment variables first
-    for var in AUTH_TOKEN_ENV_VARS:
-        if os.environ.get(var):
-            return var
-
-    # Check if token came from macOS Keychain
-    if get_token_from_keychain():
-        return "macOS Keychain"
-
-    return None
+    return _resolve_auth_token()[1]
 
 
 def require_auth_token() -> str:
@@ -142,7 +283,7 @@ def require_auth_token() -> str:
             "Direct API keys (ANTHROPIC_API_KEY) are not supported.\n\n"
         )
         # Provide platform-specific guidance
-        if platform.system() == "Darwin":
+        if _IS_DARWIN:
             error_msg += (
                 "To authenticate:\n"
                 "  1. Run: claude setup-token\n"
@@ -169,12 +310,7 @@ def get_sdk_env_vars() -> dict[str, str]:
     Returns:
         Dict of env var name -> value for non-empty vars
     """
-    env = {}
-    for var in SDK_ENV_VARS:
-        value = os.environ.get(var)
-        if value:
-            env[var] = value
-    return env
+    return {var: value for var in SDK_ENV_VARS if (value := os.environ.get(var))}
 
 
 def ensure_claude_code_oauth_token() -> None:
@@ -358,6 +358,13 @@ class GraphitiConfig:
         full_path.parent.mkdir(parents=True, exist_ok=True)
         return full_path
 
+    @property
+    def ollama_base_url_v1(self) -> str:
+        """Ollama base URL normalized to its OpenAI-compatible /v1 endpoint."""
+        if self.ollama_base_url.endswith("/v1"):
+            return self.ollama_base_url
+        return self.ollama_base_url.rstrip("/") + "/v1"
+
     def get_provider_summary(self) -> str:
         """Get a summary of configured providers."""
         return f"LLM: {self.llm_provider}, Embedder: {self.embedder_provider}"
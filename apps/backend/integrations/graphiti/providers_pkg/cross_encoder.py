@@ -49,14 +49,10 @@ def create_cross_encoder(
 
     try:
         # Create LLM config for reranker
-        base_url = config.ollama_base_url
-        if not base_url.endswith("/v1"):
-            base_url = base_url.rstrip("/") + "/v1"
-
         llm_config = LLMConfig(
             api_key="ollama",
             model=config.ollama_llm_model,
-            base_url=base_url,
+            base_url=config.ollama_base_url_v1,
         )
 
         return OpenAIRerankerClient(client=llm_client, config=llm_config)
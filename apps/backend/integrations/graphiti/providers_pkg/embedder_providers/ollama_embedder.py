@@ -112,16 +112,11 @@ def create_ollama_embedder(config: "GraphitiConfig") -> Any:
         config.ollama_embedding_dim,
     )
 
-    # Ensure Ollama base URL ends with /v1 for OpenAI compatibility
-    base_url = config.ollama_base_url
-    if not base_url.endswith("/v1"):
-        base_url = base_url.rstrip("/") + "/v1"
-
     embedder_config = OpenAIEmbedderConfig(
         api_key="ollama",  # Ollama requires a dummy API key
         embedding_model=config.ollama_embedding_model,
         embedding_dim=embedding_dim,
-        base_url=base_url,
+        base_url=config.ollama_base_url_v1,
     )
 
     return OpenAIEmbedder(config=embedder_config)
@@ -5,6 +5,8 @@ Anthropic LLM Provider
 Anthropic LLM client implementation for Graphiti.
 """
 
+import asyncio
+import os
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -12,22 +14,35 @@ if TYPE_CHECKING:
 
 from ..exceptions import ProviderError, ProviderNotInstalled
 
+# Resolved (AsyncAnthropic, AnthropicClient, LLMConfig) classes, imported on first use
+_CLASSES: tuple[Any, Any, Any] | None = None
 
-def create_anthropic_llm_client(config: "GraphitiConfig") -> Any:
-    """
-    Create Anthropic LLM client.
+# Shared AsyncAnthropic HTTP clients keyed by (api_key, base_url), scoped per
+# event loop so a connection pool is never reused after its loop has closed.
+# A client's pooled connections reference their loop, so a weak mapping would
+# never release it; entries for closed loops are evicted on each access instead.
+_anthropic_client_cache: dict[
+    asyncio.AbstractEventLoop, dict[tuple[str, str | None], Any]
+] = {}
 
-    Args:
-        config: GraphitiConfig with Anthropic settings
+
+def _load_anthropic_classes() -> tuple[Any, Any, Any]:
+    """
+    Import and memoize the Anthropic SDK and graphiti-core client classes.
 
     Returns:
-        Anthropic LLM client instance
+        Tuple of (AsyncAnthropic, AnthropicClient, LLMConfig)
 
     Raises:
         ProviderNotInstalled: If graphiti-core[anthropic] is not installed
-        ProviderError: If API key is missing
     """
+    global _CLASSES
+
+    if _CLASSES is not None:
+        return _CLASSES
+
     try:
+        from anthropic import AsyncAnthropic
         from graphiti_core.llm_client.anthropic_client import AnthropicClient
         from graphiti_core.llm_client.config import LLMConfig
     except ImportError as e:
@@ -37,6 +52,67 @@ def create_anthropic_llm_client(config: "GraphitiConfig") -> Any:
             f"Error: {e}"
         )
 
+    _CLASSES = (AsyncAnthropic, AnthropicClient, LLMConfig)
+    return _CLASSES
+
+
+def _get_shared_async_anthropic(async_anthropic_cls: Any, api_key: str) -> Any | None:
+    """
+    Get the AsyncAnthropic client shared within the running event loop.
+
+    Args:
+        async_anthropic_cls: The AsyncAnthropic class
+        api_key: Anthropic API key
+
+    Returns:
+        Shared AsyncAnthropic instance, or None when called outside an
+        event loop (the caller then lets graphiti-core build its own)
+    """
+    _evict_closed_loops()
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    base_url = os.environ.get("ANTHROPIC_BASE_URL") or None
+    key = (api_key, base_url)
+
+    clients = _anthropic_client_cache.setdefault(loop, {})
+    client = clients.get(key)
+    if client is None:
+        # Same retry policy graphiti-core uses for the clients it creates
+        client = async_anthropic_cls(api_key=api_key, base_url=base_url, max_retries=1)
+        clients[key] = client
+
+    return client
+
+
+def _evict_closed_loops() -> None:
+    """Drop shared clients whose event loop has closed so both can be freed."""
+    for loop in [loop for loop in _anthropic_client_cache if loop.is_closed()]:
+        del _anthropic_client_cache[loop]
+
+
+def create_anthropic_llm_client(config: "GraphitiConfig") -> Any:
+    """
+    Create Anthropic LLM client.
+
+    Within an event loop, clients created with the same API key share one
+    underlying AsyncAnthropic HTTP client and its connection pool.
+
+    Args:
+        config: GraphitiConfig with Anthropic settings
+
+    Returns:
+        Anthropic LLM client instance
+
+    Raises:
+        ProviderNotInstalled: If graphiti-core[anthropic] is not installed
+        ProviderError: If API key is missing
+    """
+    AsyncAnthropic, AnthropicClient, LLMConfig = _load_anthropic_classes()
+
     if not config.anthropic_api_key:
         raise ProviderError("Anthropic provider requires ANTHROPIC_API_KEY")
 
@@ -45,4 +121,5 @@ def create_anthropic_llm_client(config: "GraphitiConfig") -> Any:
         model=config.anthropic_model,
     )
 
-    return AnthropicClient(config=llm_config)
+    client = _get_shared_async_anthropic(AsyncAnthropic, config.anthropic_api_key)
+    return AnthropicClient(config=llm_config, client=client)
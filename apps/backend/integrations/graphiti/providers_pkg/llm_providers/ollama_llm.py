@@ -12,21 +12,25 @@ if TYPE_CHECKING:
 
 from ..exceptions import ProviderError, ProviderNotInstalled
 
+# Resolved (OpenAIGenericClient, LLMConfig) classes, imported on first use
+_CLASSES: tuple[Any, Any] | None = None
 
-def create_ollama_llm_client(config: "GraphitiConfig") -> Any:
-    """
-    Create Ollama LLM client (using OpenAI-compatible interface).
 
-    Args:
-        config: GraphitiConfig with Ollama settings
+def _load_ollama_classes() -> tuple[Any, Any]:
+    """
+    Import and memoize the graphiti-core OpenAI-compatible client classes.
 
     Returns:
-        Ollama LLM client instance
+        Tuple of (OpenAIGenericClient, LLMConfig)
 
     Raises:
         ProviderNotInstalled: If graphiti-core is not installed
-        ProviderError: If model is not specified
     """
+    global _CLASSES
+
+    if _CLASSES is not None:
+        return _CLASSES
+
     try:
         from graphiti_core.llm_client.config import LLMConfig
         from graphiti_core.llm_client.openai_generic_client import OpenAIGenericClient
@@ -37,19 +41,34 @@ def create_ollama_llm_client(config: "GraphitiConfig") -> Any:
             f"Error: {e}"
         )
 
+    _CLASSES = (OpenAIGenericClient, LLMConfig)
+    return _CLASSES
+
+
+def create_ollama_llm_client(config: "GraphitiConfig") -> Any:
+    """
+    Create Ollama LLM client (using OpenAI-compatible interface).
+
+    Args:
+        config: GraphitiConfig with Ollama settings
+
+    Returns:
+        Ollama LLM client instance
+
+    Raises:
+        ProviderNotInstalled: If graphiti-core is not installed
+        ProviderError: If model is not specified
+    """
+    OpenAIGenericClient, LLMConfig = _load_ollama_classes()
+
     if not config.ollama_llm_model:
         raise ProviderError("Ollama provider requires OLLAMA_LLM_MODEL")
 
-    # Ensure Ollama base URL ends with /v1 for OpenAI compatibility
-    base_url = config.ollama_base_url
-    if not base_url.endswith("/v1"):
-        base_url = base_url.rstrip("/") + "/v1"
-
     llm_config = LLMConfig(
         api_key="ollama",  # Ollama requires a dummy API key
         model=config.ollama_llm_model,
         small_model=config.ollama_llm_model,
-        base_url=base_url,
+        base_url=config.ollama_base_url_v1,
     )
 
     return OpenAIGenericClient(config=llm_config)
@@ -16,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -28,6 +29,10 @@ except (ImportError, ValueError, SystemError):
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Markers of a GitHub rate-limit failure in gh stderr (HTTP 403/429 or message),
+# compiled once so each failed command is classified in a single pass
+_RATE_LIMIT_RE = re.compile(r"403|429|rate limit", re.IGNORECASE)
+
 
 class GHTimeoutError(Exception):
     """Raised when gh CLI command times out after all retry attempts."""
@@ -212,12 +217,7 @@ class GHClient:
                     )
 
                     # Check for rate limit errors (403/429)
-                    error_lower = stderr_str.lower()
-                    if (
-                        "403" in stderr_str
-                        or "429" in stderr_str
-                        or "rate limit" in error_lower
-                    ):
+                    if _RATE_LIMIT_RE.search(stderr_str):
                         if self.enable_rate_limiting:
                             self._rate_limiter.record_github_error()
                         raise RateLimitExceeded(
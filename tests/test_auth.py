@@ -0,0 +1,285 @@
+"""
+Tests for core.auth token resolution.
+
+Covers macOS Keychain lookup caching and the environment/Keychain
+resolution order used by get_auth_token and get_auth_token_source.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add auto-claude to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core import auth
+
+VALID_TOKEN = "sk-ant-oat01-test-token"
+
+
+def _keychain_result(token: str = VALID_TOKEN, returncode: int = 0):
+    """Build a fake CompletedProcess for the security CLI."""
+    stdout = json.dumps({"claudeAiOauth": {"accessToken": token}}).encode()
+    return subprocess.CompletedProcess(
+        args=["/usr/bin/security"], returncode=returncode, stdout=stdout, stderr=None
+    )
+
+
+@pytest.fixture(autouse=True)
+def clean_auth_state(monkeypatch):
+    """Clear auth env vars and the Keychain cache around each test."""
+    for var in auth.AUTH_TOKEN_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    auth._invalidate_keychain_cache()
+    yield
+    auth._invalidate_keychain_cache()
+
+
+class TestKeychainCache:
+    """Tests for get_token_from_keychain caching."""
+
+    def test_non_darwin_returns_none(self):
+        """Keychain is never queried off macOS."""
+        with (
+            patch("core.auth._IS_DARWIN", False),
+            patch("core.auth.subprocess.run") as mock_run,
+        ):
+            assert auth.get_token_from_keychain() is None
+            mock_run.assert_not_called()
+
+    def test_token_is_cached(self):
+        """Repeated lookups only spawn the security CLI once."""
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch(
+                "core.auth.subprocess.run", return_value=_keychain_result()
+            ) as mock_run,
+        ):
+            assert auth.get_token_from_keychain() == VALID_TOKEN
+            assert auth.get_token_from_keychain() == VALID_TOKEN
+            assert mock_run.call_count == 1
+
+    def test_miss_is_cached(self):
+        """A failed lookup is cached as None rather than retried."""
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch(
+                "core.auth.subprocess.run", return_value=_keychain_result(returncode=44)
+            ) as mock_run,
+        ):
+            assert auth.get_token_from_keychain() is None
+            assert auth.get_token_from_keychain() is None
+            assert mock_run.call_count == 1
+
+    def test_invalidate_forces_requery(self):
+        """Invalidating the cache triggers a fresh lookup."""
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch(
+                "core.auth.subprocess.run", return_value=_keychain_result()
+            ) as mock_run,
+        ):
+            auth.get_token_from_keychain()
+            auth._invalidate_keychain_cache()
+            auth.get_token_from_keychain()
+            assert mock_run.call_count == 2
+
+    def test_invalid_token_prefix_rejected(self):
+        """Tokens without the OAuth prefix are ignored."""
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch(
+                "core.auth.subprocess.run",
+                return_value=_keychain_result("sk-ant-api-x"),
+            ),
+        ):
+            assert auth.get_token_from_keychain() is None
+
+
+class TestKeychainSubprocess:
+    """Tests for security CLI error handling."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            subprocess.TimeoutExpired(cmd="security", timeout=5),
+            FileNotFoundError("/usr/bin/security"),
+        ],
+    )
+    def test_expected_failures_return_none(self, error):
+        """A hung or missing security CLI is treated as a missing token."""
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch("core.auth.subprocess.run", side_effect=error),
+        ):
+            assert auth.get_token_from_keychain() is None
+
+    def test_unexpected_errors_propagate(self):
+        """Bugs outside SubprocessError/OSError are not swallowed."""
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch("core.auth.subprocess.run", side_effect=TypeError("bad call")),
+        ):
+            with pytest.raises(TypeError, match="bad call"):
+                auth.get_token_from_keychain()
+
+
+class TestExtractOauthToken:
+    """Tests for parsing the Keychain credentials payload."""
+
+    def test_pretty_printed_payload(self):
+        """Whitespace around the key doesn't defeat extraction."""
+        payload = json.dumps({"claudeAiOauth": {"accessToken": VALID_TOKEN}}, indent=2)
+        assert auth._extract_oauth_token(payload.encode()) == VALID_TOKEN
+
+    def test_escaped_payload_uses_json_fallback(self):
+        """Escaped JSON strings are still decoded via the JSON path."""
+        payload = b'{"claudeAiOauth": {"accessToken": "sk-ant-oat01-\\u0061bc"}}'
+        assert auth._extract_oauth_token(payload) == "sk-ant-oat01-abc"
+
+    def test_missing_or_malformed_payload(self):
+        """Empty, invalid, or token-less payloads yield None."""
+        assert auth._extract_oauth_token(b"") is None
+        assert auth._extract_oauth_token(b"not json") is None
+        assert auth._extract_oauth_token(b'{"claudeAiOauth": {}}') is None
+        assert auth._extract_oauth_token(b"[]") is None
+        assert auth._extract_oauth_token(b'{"claudeAiOauth": "x"}') is None
+        assert (
+            auth._extract_oauth_token(b'{"claudeAiOauth": {"accessToken": 1}}') is None
+        )
+
+    def test_non_utf8_payload_returns_none(self):
+        """Undecodable bytes in the token never raise out of extraction."""
+        payload = b'{"claudeAiOauth": {"accessToken": "sk-ant-oat01-\xff\xfe"}}'
+        assert auth._extract_oauth_token(payload) is None
+
+
+class TestKeychainPrefetch:
+    """Tests for the startup background Keychain lookup."""
+
+    def test_prefetch_warms_cache(self):
+        """A prefetch fills the cache so later lookups don't re-query."""
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch(
+                "core.auth.subprocess.run", return_value=_keychain_result()
+            ) as mock_run,
+        ):
+            auth.prefetch_keychain_token()
+            assert auth.get_token_from_keychain() == VALID_TOKEN
+            assert auth.get_token_from_keychain() == VALID_TOKEN
+            assert mock_run.call_count == 1
+
+    def test_stalled_prefetch_does_not_requery(self, monkeypatch):
+        """A prefetch that outlives the join timeout isn't duplicated."""
+        release = threading.Event()
+
+        def slow_run(*args, **kwargs):
+            release.wait(timeout=5)
+            return _keychain_result()
+
+        monkeypatch.setattr(auth, "KEYCHAIN_PREFETCH_JOIN_TIMEOUT", 0.01)
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch("core.auth.subprocess.run", side_effect=slow_run) as mock_run,
+        ):
+            auth.prefetch_keychain_token()
+            thread = auth._keychain_prefetch_thread
+            try:
+                assert auth.get_token_from_keychain() is None
+                assert mock_run.call_count == 1
+            finally:
+                release.set()
+                thread.join(timeout=5)
+            assert auth.get_token_from_keychain() == VALID_TOKEN
+            assert mock_run.call_count == 1
+
+    def test_invalidated_prefetch_does_not_write_stale_token(self):
+        """A prefetch finishing after invalidation leaves the cache empty."""
+        release = threading.Event()
+
+        def slow_run(*args, **kwargs):
+            release.wait(timeout=5)
+            return _keychain_result()
+
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch("core.auth.subprocess.run", side_effect=slow_run),
+        ):
+            auth.prefetch_keychain_token()
+            thread = auth._keychain_prefetch_thread
+            auth._invalidate_keychain_cache()
+            release.set()
+            thread.join(timeout=5)
+            assert auth._keychain_token_cache is auth._KEYCHAIN_TOKEN_SENTINEL
+
+    def test_prefetch_skipped_with_env_token(self, monkeypatch):
+        """No background lookup when an env token is already set."""
+        monkeypatch.setenv("CLAUDE_CODE_OAUTH_TOKEN", "env-token")
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch("core.auth.threading.Thread") as mock_thread,
+        ):
+            auth.prefetch_keychain_token()
+            mock_thread.assert_not_called()
+
+    def test_prefetch_skipped_off_darwin(self):
+        """No background lookup off macOS."""
+        with (
+            patch("core.auth._IS_DARWIN", False),
+            patch("core.auth.threading.Thread") as mock_thread,
+        ):
+            auth.prefetch_keychain_token()
+            mock_thread.assert_not_called()
+
+
+class TestAuthTokenResolution:
+    """Tests for get_auth_token and get_auth_token_source."""
+
+    def test_env_var_takes_priority(self, monkeypatch):
+        """Environment tokens win over the Keychain."""
+        monkeypatch.setenv("ANTHROPIC_AUTH_TOKEN", "env-token")
+        with patch("core.auth.get_token_from_keychain") as mock_keychain:
+            assert auth.get_auth_token() == "env-token"
+            assert auth.get_auth_token_source() == "ANTHROPIC_AUTH_TOKEN"
+            mock_keychain.assert_not_called()
+
+    def test_keychain_fallback_queries_once(self):
+        """Token and source resolution share a single Keychain lookup."""
+        with (
+            patch("core.auth._IS_DARWIN", True),
+            patch(
+                "core.auth.subprocess.run", return_value=_keychain_result()
+            ) as mock_run,
+        ):
+            assert auth.get_auth_token() == VALID_TOKEN
+            assert auth.get_auth_token_source() == "macOS Keychain"
+            assert mock_run.call_count == 1
+
+    def test_no_token_anywhere(self):
+        """No env vars and no Keychain yields None."""
+        with patch("core.auth._IS_DARWIN", False):
+            assert auth.get_auth_token() is None
+            assert auth.get_auth_token_source() is None
+
+
+class TestSdkEnvVars:
+    """Tests for get_sdk_env_vars passthrough."""
+
+    @pytest.fixture(autouse=True)
+    def clean_sdk_env(self, monkeypatch):
+        for var in auth.SDK_ENV_VARS:
+            monkeypatch.delenv(var, raising=False)
+
+    def test_collects_non_empty_vars(self, monkeypatch):
+        """Only set, non-empty variables are passed through."""
+        monkeypatch.setenv("ANTHROPIC_BASE_URL", "https://proxy.example.com")
+        monkeypatch.setenv("NO_PROXY", "")
+        assert auth.get_sdk_env_vars() == {
+            "ANTHROPIC_BASE_URL": "https://proxy.example.com"
+        }
@@ -528,3 +528,111 @@ class TestGraphitiState:
         assert len(state.error_log) == 10
         assert "Error 5" in state.error_log[0]["error"]
         assert "Error 14" in state.error_log[-1]["error"]
+
+
+class TestAnthropicClientSharing:
+    """Tests for AsyncAnthropic reuse in create_anthropic_llm_client."""
+
+    @pytest.fixture
+    def anthropic_llm(self, monkeypatch):
+        from integrations.graphiti.providers_pkg.llm_providers import anthropic_llm
+
+        class FakeClient:
+            def __init__(self, config=None, client=None):
+                self.config = config
+                self.client = client
+
+        monkeypatch.setattr(
+            anthropic_llm, "_CLASSES", (MagicMock, FakeClient, MagicMock)
+        )
+        monkeypatch.setattr(anthropic_llm, "_anthropic_client_cache", {})
+        return anthropic_llm
+
+    def _config(self, api_key="sk-ant-test"):
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": api_key}, clear=True):
+            return GraphitiConfig.from_env()
+
+    def test_same_key_shares_http_client(self, anthropic_llm):
+        """Repeat factory calls in one event loop reuse the HTTP client."""
+        import asyncio
+
+        async def create_two():
+            config = self._config()
+            return (
+                anthropic_llm.create_anthropic_llm_client(config),
+                anthropic_llm.create_anthropic_llm_client(config),
+            )
+
+        first, second = asyncio.run(create_two())
+        assert first is not second
+        assert first.client is second.client
+
+    def test_different_keys_get_separate_clients(self, anthropic_llm):
+        """Clients are keyed by API key."""
+        import asyncio
+
+        async def create_two():
+            return (
+                anthropic_llm.create_anthropic_llm_client(self._config("sk-a")),
+                anthropic_llm.create_anthropic_llm_client(self._config("sk-b")),
+            )
+
+        first, second = asyncio.run(create_two())
+        assert first.client is not second.client
+
+    def test_clients_not_shared_across_event_loops(self, anthropic_llm):
+        """A client created in a closed loop is never handed out again."""
+        import asyncio
+
+        async def create_one():
+            return anthropic_llm.create_anthropic_llm_client(self._config())
+
+        first = asyncio.run(create_one())
+        second = asyncio.run(create_one())
+        assert first.client is not second.client
+
+    def test_closed_loops_are_evicted(self, anthropic_llm, monkeypatch):
+        """Clients (and the loops they reference) are released once closed."""
+        import asyncio
+
+        class LoopBoundClient:
+            def __init__(self, **kwargs):
+                # Mimic pooled connections holding a reference to their loop
+                self.loop = asyncio.get_running_loop()
+
+        AsyncAnthropic, AnthropicClient, LLMConfig = anthropic_llm._CLASSES
+        monkeypatch.setattr(
+            anthropic_llm, "_CLASSES", (LoopBoundClient, AnthropicClient, LLMConfig)
+        )
+
+        async def create_one():
+            anthropic_llm.create_anthropic_llm_client(self._config())
+
+        for _ in range(5):
+            asyncio.run(create_one())
+        assert len(anthropic_llm._anthropic_client_cache) == 1
+
+        anthropic_llm.create_anthropic_llm_client(self._config())
+        assert anthropic_llm._anthropic_client_cache == {}
+
+    def test_no_event_loop_defers_to_graphiti(self, anthropic_llm):
+        """Outside an event loop graphiti-core builds its own client."""
+        client = anthropic_llm.create_anthropic_llm_client(self._config())
+        assert client.client is None
+
+
+class TestOllamaBaseUrl:
+    """Tests for GraphitiConfig.ollama_base_url_v1."""
+
+    @pytest.mark.parametrize(
+        "base_url",
+        [
+            "http://localhost:11434",
+            "http://localhost:11434/",
+            "http://localhost:11434/v1",
+        ],
+    )
+    def test_normalizes_to_v1(self, base_url):
+        """The OpenAI-compatible endpoint always ends in a single /v1."""
+        config = GraphitiConfig(ollama_base_url=base_url)
+        assert config.ollama_base_url_v1 == "http://localhost:11434/v1"